@@ -9,42 +9,86 @@ The conversion follows the telecommunications industry standard where
 each pair number maps to a unique combination of major and minor colors.
 """
 
+from typing import NamedTuple
+
 from color_constants import MAJOR_COLORS, MINOR_COLORS
 
 
-def get_color_from_pair_number(pair_number):
+class ColorPair(NamedTuple):
+    """
+    A major and minor color combination identifying one wire pair.
+    
+    Behaves as a plain (major, minor) tuple, so existing unpacking and
+    equality comparisons keep working, while also allowing attribute access.
+    """
+    major: str
+    minor: str
+
+
+# Lookup table of ColorPair keyed by pair number, built once at import so
+# conversions need no arithmetic and return shared instances
+_PAIR_TO_COLOR = dict(enumerate(
+    (ColorPair(major_color, minor_color)
+     for major_color in MAJOR_COLORS for minor_color in MINOR_COLORS),
+    start=1,
+))
+
+# Reverse lookup of pair number keyed by (major_color, minor_color)
+_COLOR_TO_PAIR = {pair: number for number, pair in _PAIR_TO_COLOR.items()}
+
+
+def get_color_from_pair_number(pair_number, _table=_PAIR_TO_COLOR):
     """
     Convert a pair number to its corresponding major and minor colors.
     
+    The underscore default binds the lookup table as a fast local; callers
+    never pass it.
+    
     Args:
         pair_number (int): The pair number (1-25)
         
     Returns:
-        tuple: A tuple containing (major_color, minor_color)
+        ColorPair: A shared (major_color, minor_color) named tuple
         
     Raises:
         Exception: If pair_number is out of valid range (1-25)
     """
-    # Convert to zero-based indexing for array access
-    zero_based_pair_number = pair_number - 1
-    
-    # Calculate major color index using integer division
-    major_index = zero_based_pair_number // len(MINOR_COLORS)
-    if major_index >= len(MAJOR_COLORS):
-        raise Exception('Major index out of range')
+    # Numbers outside 1-25 are simply missing from the table
+    try:
+        return _table[pair_number]
+    except KeyError:
+        raise Exception('Pair number out of range')
+
+
+def get_colors_from_pair_numbers(pair_numbers, _table=_PAIR_TO_COLOR):
+    """
+    Convert many pair numbers to their color pairs in a single batch.
     
-    # Calculate minor color index using modulo operation
-    minor_index = zero_based_pair_number % len(MINOR_COLORS)
-    if minor_index >= len(MINOR_COLORS):
-        raise Exception('Minor index out of range')
+    The underscore default binds the lookup table as a fast local; callers
+    never pass it.
     
-    return MAJOR_COLORS[major_index], MINOR_COLORS[minor_index]
+    Args:
+        pair_numbers (iterable): Pair numbers (1-25) to convert
+        
+    Returns:
+        list: The ColorPair for each pair number, in input order
+        
+    Raises:
+        Exception: If any pair_number is out of valid range (1-25)
+    """
+    try:
+        return [_table[pair_number] for pair_number in pair_numbers]
+    except KeyError:
+        raise Exception('Pair number out of range')
 
 
-def get_pair_number_from_color(major_color, minor_color):
+def get_pair_number_from_color(major_color, minor_color, _rev=_COLOR_TO_PAIR):
     """
     Convert major and minor colors to their corresponding pair number.
     
+    The underscore default binds the reverse lookup table as a fast local;
+    callers never pass it.
+    
     Args:
         major_color (str): The major color name
         minor_color (str): The minor color name
@@ -55,17 +99,20 @@ def get_pair_number_from_color(major_color, minor_color):
     Raises:
         Exception: If either color is not found in the valid color lists
     """
-    # Find the index of the major color in the major colors list
-    try:
-        major_index = MAJOR_COLORS.index(major_color)
-    except ValueError:
-        raise Exception('Major index out of range')
+    # Look up the pair number directly from the precomputed reverse table
+    pair_number = _rev.get((major_color, minor_color))
+    if pair_number is None:
+        raise Exception('Color pair not found')
     
-    # Find the index of the minor color in the minor colors list
-    try:
-        minor_index = MINOR_COLORS.index(minor_color)
-    except ValueError:
-        raise Exception('Minor index out of range')
+    return pair_number
+
+
+def get_all_color_pairs():
+    """
+    Get every color pair in pair-number order.
     
-    # Calculate pair number: (major_index * minor_colors_count) + minor_index + 1
-    return major_index * len(MINOR_COLORS) + minor_index + 1
+    Returns:
+        tuple: The precomputed ColorPair entries, where the entry at index i
+               belongs to pair number i + 1
+    """
+    return tuple(_PAIR_TO_COLOR.values())
@@ -7,9 +7,26 @@ useful for field technicians and wiring personnel who need a quick reference
 guide for identifying wire pairs in telecommunications cables.
 """
 
-from color_converter import get_color_from_pair_number
+from functools import lru_cache
 
+from color_converter import get_all_color_pairs
 
+# Fixed-width column fragments, precomputed so each manual line is plain
+# string concatenation with consistent column alignment
+# :2d formats the pair number with 2 digits
+_PAIR_PREFIX = tuple(
+    f"{pair_number:2d}          | "
+    for pair_number in range(1, len(get_all_color_pairs()) + 1)
+)
+# :<11 left-aligns the major color in 11 characters
+_MAJOR_PADDED = {
+    pair.major: f"{pair.major:<11}"
+    for pair in get_all_color_pairs()
+}
+_COLUMN_SEPARATOR = " | "
+
+
+@lru_cache(maxsize=1)
 def format_color_reference_manual():
     """
     Format the complete 25-pair color coding as a reference manual for printing.
@@ -19,6 +36,9 @@ def format_color_reference_manual():
     designed to be easily readable and suitable for printing as a reference
     card for field technicians.
     
+    The manual depends only on the color constants, so it is built once and
+    the same string is returned on every subsequent call.
+    
     Returns:
         str: A formatted string containing the complete color reference manual
              with headers, separators, and aligned columns
@@ -32,19 +52,18 @@ def format_color_reference_manual():
          2          | White       | Orange
         ...
     """
-    # Initialize manual with title and header formatting
-    manual = "Color Coding Reference Manual\n"
-    manual += "=" * 30 + "\n"  # Title underline
-    manual += "Pair Number | Major Color | Minor Color\n"
-    manual += "-" * 30 + "\n"  # Column separator
+    # Collect header lines first; all lines are joined once at the end
+    lines = [
+        "Color Coding Reference Manual",
+        "=" * 30,  # Title underline
+        "Pair Number | Major Color | Minor Color",
+        "-" * 30,  # Column separator
+    ]
     
-    # Generate entries for all 25 pair numbers
-    for pair_number in range(1, 26):
-        # Get the color pair for current number
-        major_color, minor_color = get_color_from_pair_number(pair_number)
-        
-        # Format each line with consistent column alignment
-        # :2d formats pair number with 2 digits, :<11 left-aligns major color in 11 chars
-        manual += f"{pair_number:2d}          | {major_color:<11} | {minor_color}\n"
+    # Generate entries for all 25 pairs straight from the precomputed table
+    for prefix, (major_color, minor_color) in zip(_PAIR_PREFIX,
+                                                  get_all_color_pairs()):
+        lines.append(prefix + _MAJOR_PADDED[major_color]
+                     + _COLUMN_SEPARATOR + minor_color)
     
-    return manual
+    return "\n".join(lines) + "\n"
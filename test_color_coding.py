@@ -10,7 +10,19 @@ The tests use assertions to validate that the conversions work correctly
 for various test cases covering different parts of the color code range.
 """
 
-from color_converter import get_color_from_pair_number, get_pair_number_from_color
+from color_converter import (get_color_from_pair_number,
+                             get_colors_from_pair_numbers,
+                             get_pair_number_from_color)
+from test_range_checks import run_range_tests
+
+# Number-to-color cases covering the start and end of the White range:
+# (pair_number, expected_major_color, expected_minor_color)
+_N2P_CASES = ((4, 'White', 'Brown'), (5, 'White', 'Slate'))
+
+# Color-to-number cases covering Black, the last pair and Red:
+# (major_color, minor_color, expected_pair_number)
+_P2N_CASES = (('Black', 'Orange', 12), ('Violet', 'Slate', 25),
+              ('Red', 'Orange', 7))
 
 
 def test_number_to_pair(pair_number,
@@ -76,21 +88,32 @@ def run_all_tests():
     - Color pair to number conversions for various combinations
     - Both directions work consistently (round-trip testing)
     
-    The test cases cover:
-    - Early pairs (White major color combinations)
-    - Middle pairs (Black major color combinations) 
-    - End pairs (Red and Violet major color combinations)
+    The spot checks are driven by the _N2P_CASES and _P2N_CASES tables, which
+    cover early (White), middle (Black) and end (Red, Violet) pairs. The
+    round-trip sweep then checks every pair number from 1 to 25, and
+    run_range_tests checks that out-of-range pair numbers are rejected.
     
     Prints success message if all tests pass, raises AssertionError if any fail.
     """
     # Test number-to-color conversions
-    test_number_to_pair(4, 'White', 'Brown')   # Test White major color
-    test_number_to_pair(5, 'White', 'Slate')   # Test end of White range
+    for pair_number, major_color, minor_color in _N2P_CASES:
+        test_number_to_pair(pair_number, major_color, minor_color)
     
     # Test color-to-number conversions
-    test_pair_to_number('Black', 'Orange', 12)  # Test Black major color
-    test_pair_to_number('Violet', 'Slate', 25)  # Test last possible pair
-    test_pair_to_number('Red', 'Orange', 7)     # Test Red major color
+    for major_color, minor_color, pair_number in _P2N_CASES:
+        test_pair_to_number(major_color, minor_color, pair_number)
+    
+    # Round-trip every pair number through both conversions
+    for pair_number in range(1, 26):
+        major_color, minor_color = get_color_from_pair_number(pair_number)
+        test_pair_to_number(major_color, minor_color, pair_number)
+    
+    # Batch conversion must agree with the single-number conversion
+    assert(get_colors_from_pair_numbers(range(1, 26)) ==
+           [get_color_from_pair_number(n) for n in range(1, 26)])
+    
+    # Out-of-range pair numbers must raise the range error
+    run_range_tests()
     
     # All tests completed successfully
     print('All tests passed!')
@@ -0,0 +1,52 @@
+"""
+Range-check tests for the pair number conversion functions.
+
+This module verifies that pair numbers outside the valid range (1-25) are
+rejected with the converter's range error, both for single conversions and
+for batch conversions. It is kept separate from test_color_coding so each
+test module stays within the 30 NLOC limit.
+"""
+
+from color_converter import (get_color_from_pair_number,
+                             get_colors_from_pair_numbers)
+
+
+def test_out_of_range(convert, bad_input):
+    """
+    Test that a conversion rejects an out-of-range pair number.
+    
+    This function verifies that calling the conversion with the given input
+    raises the converter's range error, rather than returning a value or
+    failing with some unrelated error.
+    
+    Args:
+        convert (callable): The conversion function to test
+        bad_input: Input containing a pair number outside 1-25
+        
+    Raises:
+        AssertionError: If no error is raised or the error is not the
+                        range error
+        
+    Example:
+        >>> test_out_of_range(get_color_from_pair_number, 26)
+        # Passes if pair number 26 is rejected as out of range
+    """
+    # Call the conversion and capture the error it raises
+    try:
+        convert(bad_input)
+    except Exception as error:
+        assert(str(error) == 'Pair number out of range')
+    else:
+        raise AssertionError(f'{convert.__name__}({bad_input}) did not raise')
+
+
+def run_range_tests():
+    """
+    Execute the out-of-range test cases for both pair number conversions.
+    
+    Covers the numbers just below (0) and just above (26) the valid range,
+    and a batch where only one of the numbers is invalid.
+    """
+    for bad_number in (0, 26):
+        test_out_of_range(get_color_from_pair_number, bad_number)
+    test_out_of_range(get_colors_from_pair_numbers, [1, 26])